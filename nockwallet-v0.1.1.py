@@ -7,23 +7,32 @@ Interface graphique pour le wallet Nockchain
 """
 
 import sys
+import os
+import shutil
 import subprocess
-import logging
+import tempfile
+import threading
 import time
+import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import re
 import json
+import shlex
+from functools import lru_cache
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QTextEdit, QFileDialog,
     QMessageBox, QTabWidget, QGroupBox, QRadioButton, QCheckBox,
-    QTableWidget, QTableWidgetItem, QStatusBar, QComboBox,
+    QTableView, QHeaderView, QStatusBar, QComboBox,
     QSpinBox
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QAbstractTableModel, QModelIndex
+)
+from PyQt6.QtGui import QFont, QPalette, QColor, QTextCharFormat, QTextCursor
 
 # Logging
 logging.basicConfig(
@@ -32,6 +41,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sérialisation JSON: orjson si disponible, sinon json (stdlib)
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # Config global dynamic from JSON
 CONFIG_FILE = Path(__file__).parent / "config.json"
 
@@ -41,182 +66,378 @@ default_config = {
     'wallet_imported': False,
     'client_type': 'public',
     'public_server': 'https://nockchain-api.zorp.io',
-    'private_port': '50051'
+    'private_port': '50051',
+    'binary_probe': None,
+    'balance_cache_ttl_ms': 500,
+    'notes_cache_ttl_ms': 2000
 }
 
+# Dernier contenu lu/écrit, pour éviter les réécritures identiques
+_last_config_bytes: Optional[bytes] = None
+
 def load_config():
+    global _last_config_bytes
     try:
         if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
-                merged = {**default_config, **config_data}
-                return merged
+            data = CONFIG_FILE.read_bytes()
+            config_data = _loads(data)
+            _last_config_bytes = data
+            merged = {**default_config, **config_data}
+            return merged
     except Exception as e:
-        logger.error(f"Erreur lecture config.json: {e}")
+        logger.error("Erreur lecture config.json: %s", e)
     return default_config.copy()
 
 def save_config():
+    global _last_config_bytes
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
+        payload = _dumps(config)
+        if payload == _last_config_bytes:
+            return
+        tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, CONFIG_FILE)
+        _last_config_bytes = payload
         logger.info("Configuration sauvegardée.")
     except Exception as e:
-        logger.error(f"Erreur sauvegarde config.json: {e}")
+        logger.error("Erreur sauvegarde config.json: %s", e)
 
 config = load_config()
 
+# Motifs regex précompilés pour WalletOutputParser
+# Tous les champs de show-balance en une alternance. Le tout est placé dans un
+# lookahead: les correspondances sont de largeur nulle et peuvent donc se
+# chevaucher, comme des recherches séparées ('from block at height 7').
+_RE_STATUS = re.compile(
+    r'(?=(?i:Balance:\s*(?P<balance>\d[\d,]*)\s*nicks?)'
+    r'|Wallet Version:\s*(?P<version>.+)'
+    r'|(?i:at height\s*(?P<height>[\d.,]+))'
+    r'|(?i:Number of Notes:\s*(?P<notes>\d+))'
+    r'|from block\s+(?P<block_hash>[A-Za-z0-9]+))'
+)
+_RE_NOTE_ID = re.compile(r'[0-9a-zA-Z]{40,}')
+_RE_SUCCESS = re.compile(r'successfully', re.IGNORECASE)
+_RE_ERROR_NOISE = re.compile(
+    r'\[\d+m|trace|debug|kernel::boot|nockapp boot|save interval', re.IGNORECASE
+)
+
+# Lignes de bruit ignorées par clean_output
+_CLEAN_SKIP_PATTERNS = (
+    'kernel::boot',
+    'NockApp boot cli',
+    'build-hash',
+    'nockapp: Nockapp save interval',
+    'Command requires syncing',
+    'Connected to public',
+    'Received balance update'
+)
+_RE_CLEAN_SKIP = re.compile('|'.join(map(re.escape, _CLEAN_SKIP_PATTERNS)))
+
+# Séparateurs de milliers supprimés avant int()
+_DIGIT_SEPARATORS = str.maketrans('', '', ',.')
+
+@lru_cache(maxsize=32)
+def _format_command(cmd: tuple) -> str:
+    """Ligne de commande affichable, quotée selon les règles de la plateforme"""
+    if os.name == 'nt':
+        return subprocess.list2cmdline(cmd)
+    return shlex.join(cmd)
+
 class WalletOutputParser:
     """Parse les sorties du binaire nockchain-wallet"""
     @staticmethod
-    def parse_balance(output: str) -> Optional[Dict[str, Any]]:
-        try:
-            match = re.search(r'Balance:\s*(\d[\d,]*)\s*nicks?', output, re.IGNORECASE)
-            if match:
-                balance_str = match.group(1).replace(',', '')
-                balance = int(balance_str)
-                return {
-                    'balance': balance,
-                    'formatted': f"{balance:,} nicks"
-                }
-            return None
-        except Exception as e:
-            logger.error(f"Erreur parse balance: {e}")
-            return None
-    @staticmethod
-    def parse_wallet_version(output: str) -> Optional[str]:
-        try:
-            match = re.search(r'Wallet Version:\s*(.+)', output)
-            if match:
-                return match.group(1).strip()
-            return None
-        except Exception as e:
-            logger.error(f"Erreur parse version: {e}")
-            return None
-    @staticmethod
-    def parse_height(output: str) -> Optional[int]:
-        try:
-            match = re.search(r'at height\s*([\d.,]+)', output, re.IGNORECASE)
-            if match:
-                height_str = match.group(1).replace(',', '').replace('.', '')
-                return int(height_str)
-            return None
-        except Exception as e:
-            logger.error(f"Erreur parse height: {e}")
-            return None
-    @staticmethod
-    def parse_number_of_notes(output: str) -> Optional[int]:
-        try:
-            match = re.search(r'Number of Notes:\s*(\d+)', output, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-            return None
-        except Exception as e:
-            logger.error(f"Erreur parse notes count: {e}")
-            return None
+    def _balance_info(balance: int) -> Dict[str, Any]:
+        return {
+            'balance': balance,
+            'formatted': f"{balance:,} nicks"
+        }
     @staticmethod
-    def parse_block_hash(output: str) -> Optional[str]:
-        try:
-            match = re.search(r'from block\s+([A-Za-z0-9]+)', output)
-            if match:
-                return match.group(1)
-            return None
-        except Exception as e:
-            logger.error(f"Erreur parse block hash: {e}")
-            return None
+    def parse_status(output: str) -> Dict[str, Any]:
+        """Solde, version, hauteur, nombre de notes et bloc en un seul passage regex"""
+        status = {'balance': None, 'version': None, 'height': None, 'notes': None, 'block_hash': None}
+        found = {}
+        for match in _RE_STATUS.finditer(output):
+            found.setdefault(match.lastgroup, match.group(match.lastgroup))
+            if len(found) == len(status):
+                break
+        if 'balance' in found:
+            status['balance'] = WalletOutputParser._balance_info(
+                int(found['balance'].translate(_DIGIT_SEPARATORS))
+            )
+        if 'version' in found:
+            status['version'] = found['version'].strip()
+        height_digits = found.get('height', '').translate(_DIGIT_SEPARATORS)
+        if height_digits:
+            status['height'] = int(height_digits)
+        if 'notes' in found:
+            status['notes'] = int(found['notes'])
+        status['block_hash'] = found.get('block_hash')
+        return status
     @staticmethod
-    def parse_notes(output: str) -> list:
-        notes = []
-        try:
-            lines = output.split('\n')
-            for line in lines:
-                if re.search(r'[0-9a-zA-Z]{40,}', line):
-                    notes.append(line.strip())
-            return notes
-        except Exception as e:
-            logger.error(f"Erreur parse notes: {e}")
-            return []
+    def is_note_line(line: str) -> bool:
+        return _RE_NOTE_ID.search(line) is not None
     @staticmethod
     def extract_success_message(output: str) -> Optional[str]:
-        try:
-            if "Command executed successfully" in output:
-                return "✓ Commande exécutée avec succès"
-            if "successfully" in output.lower():
-                return "✓ Opération réussie"
-            return None
-        except:
-            return None
+        if "Command executed successfully" in output:
+            return "✓ Commande exécutée avec succès"
+        if _RE_SUCCESS.search(output):
+            return "✓ Opération réussie"
+        return None
     @staticmethod
     def extract_error(stderr: str) -> str:
-        try:
-            lines = stderr.split('\n')
-            error_lines = []
-            skip_patterns = [
-                '[0m', '[32m', '[33m', 
-                'trace', 'debug',
-                'kernel::boot',
-                'NockApp boot',
-                'save interval'
-            ]
-            for line in lines:
-                line = line.strip()
-                if line and not any(pattern in line.lower() for pattern in skip_patterns):
-                    if not line.startswith('--'):
-                        error_lines.append(line)
-            return '\n'.join(error_lines) if error_lines else stderr
-        except:
-            return stderr
+        error_lines = [
+            line for line in (raw.strip() for raw in stderr.split('\n'))
+            if line and not line.startswith('--') and not _RE_ERROR_NOISE.search(line)
+        ]
+        return '\n'.join(error_lines) if error_lines else stderr
     @staticmethod
     def clean_output(output: str) -> str:
-        try:
-            lines = output.split('\n')
-            clean_lines = []
-            skip_patterns = [
-                'kernel::boot',
-                'NockApp boot cli',
-                'build-hash',
-                'nockapp: Nockapp save interval',
-                'Command requires syncing',
-                'Connected to public',
-                'Received balance update'
-            ]
-            for line in lines:
-                if line.strip() and not any(pattern in line for pattern in skip_patterns):
-                    cleaned = re.sub(r'^I \(\d+:\d+:\d+\)\s*', '', line)
-                    cleaned = re.sub(r'^\[.*?\]\s*', '', cleaned)
-                    if cleaned.strip():
-                        clean_lines.append(cleaned.strip())
-            return '\n'.join(clean_lines)
-        except:
-            return output
+        lines = output.split('\n')
+        clean_lines = []
+        for line in lines:
+            if line.strip() and not _RE_CLEAN_SKIP.search(line):
+                cleaned = line
+                # Préfixe horodaté 'I (hh:mm:ss)'
+                if cleaned.startswith('I ('):
+                    end = cleaned.find(')')
+                    fields = cleaned[3:end].split(':') if end != -1 else ()
+                    if len(fields) == 3 and all(field.isdecimal() for field in fields):
+                        cleaned = cleaned[end + 1:].lstrip()
+                # Préfixe '[module]'
+                if cleaned.startswith('['):
+                    end = cleaned.find(']')
+                    if end != -1:
+                        cleaned = cleaned[end + 1:]
+                cleaned = cleaned.strip()
+                if cleaned:
+                    clean_lines.append(cleaned)
+        return '\n'.join(clean_lines)
 
 class LogArea(QTextEdit):
+    COLORS = {
+        "info": "#FFFFFF",
+        "success": "#4CAF50",
+        "warning": "#FF9800",
+        "error": "#F44336",
+        "command": "#2196F3"
+    }
+    MAX_BLOCKS = 1000
     def __init__(self):
         super().__init__()
         self.setReadOnly(True)
         self.setMaximumHeight(200)
         font = QFont("Courier", 10)
         self.setFont(font)
+        self.document().setMaximumBlockCount(self.MAX_BLOCKS)
+        self._formats = {}
+        for log_type, color in self.COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[log_type] = fmt
     def append_log(self, message: str, log_type: str = "info"):
-        colors = {
-            "info": "#FFFFFF",
-            "success": "#4CAF50",
-            "warning": "#FF9800",
-            "error": "#F44336",
-            "command": "#2196F3"
-        }
-        color = colors.get(log_type, "#FFFFFF")
-        self.append(f'<span style="color: {color};">{message}</span>')
+        scrollbar = self.verticalScrollBar()
+        # Comme QTextEdit.append: on ne suit la fin que si la vue y était déjà
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(message, self._formats.get(log_type, self._formats["info"]))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+class NotesModel(QAbstractTableModel):
+    """Modèle de la table des notes, adossé à une simple liste de lignes"""
+    HEADERS = ["☑", "Note ID", "Montant", "Conf."]
+    NOTE_COLUMN = 1
+    def __init__(self):
+        super().__init__()
+        self.rows: List[str] = []
+    def set_notes(self, notes: List[str]):
+        self.beginResetModel()
+        self.rows = notes
+        self.endResetModel()
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.column() == self.NOTE_COLUMN:
+            return self.rows[index.row()]
+        return None
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+class WalletTaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    line = pyqtSignal(str)
+
+class WalletTask(QRunnable):
+    """Exécute une commande du binaire wallet dans un thread du pool Qt"""
+    def __init__(self, cmd: list, timeout: int, capture_stdout: bool = True,
+                 capture_stderr: bool = True):
+        super().__init__()
+        self.cmd = cmd
+        self.timeout = timeout
+        self.capture_stdout = capture_stdout
+        self.capture_stderr = capture_stderr
+        self.signals = WalletTaskSignals()
+    def run(self):
+        try:
+            result = subprocess.run(
+                self.cmd,
+                stdout=subprocess.PIPE if self.capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE if self.capture_stderr else subprocess.DEVNULL,
+                text=True,
+                timeout=self.timeout
+            )
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+class StreamingWalletTask(WalletTask):
+    """WalletTask qui émet chaque ligne de stdout et de stderr dès sa lecture"""
+    def run(self):
+        stdout_lines = []
+        stderr_lines = []
+        def handle_line(line: str):
+            stdout_lines.append(line)
+            self.signals.line.emit(line.rstrip('\n'))
+        try:
+            proc = subprocess.Popen(
+                self.cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+            # stderr lu dans son propre thread: les deux flux restent séparés
+            stderr_reader = threading.Thread(
+                target=self._drain_stderr, args=(proc.stderr, stderr_lines), daemon=True
+            )
+            stderr_reader.start()
+            try:
+                returncode = self._read_lines(proc, handle_line)
+            finally:
+                stderr_reader.join()
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(subprocess.CompletedProcess(
+            self.cmd, returncode, ''.join(stdout_lines), ''.join(stderr_lines)
+        ))
+    def _drain_stderr(self, stream, lines: list):
+        with stream:
+            for line in stream:
+                lines.append(line)
+                self.signals.line.emit(line.rstrip('\n'))
+    def _read_lines(self, proc: subprocess.Popen, handle_line) -> int:
+        """Passe chaque ligne de stdout à handle_line; tue le process au-delà du timeout"""
+        timed_out = threading.Event()
+        def kill():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(self.timeout, kill)
+        timer.start()
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    handle_line(line)
+            returncode = proc.wait()
+        except Exception:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            timer.cancel()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(self.cmd, self.timeout)
+        return returncode
+
+class FilteredWalletTask(StreamingWalletTask):
+    """Lit stdout au fil de l'eau et ne conserve que les lignes acceptées par keep_line.
+    Le stdout du résultat est la liste de ces lignes, déjà strippées."""
+    def __init__(self, cmd: list, timeout: int, keep_line):
+        super().__init__(cmd, timeout)
+        self.keep_line = keep_line
+    def run(self):
+        kept = []
+        def handle_line(line: str):
+            if self.keep_line(line):
+                kept.append(line.strip())
+        try:
+            # stderr part dans un fichier temporaire: pas de pipe à vider en parallèle
+            with tempfile.TemporaryFile(mode='w+') as stderr_file:
+                proc = subprocess.Popen(
+                    self.cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                    bufsize=1
+                )
+                returncode = self._read_lines(proc, handle_line)
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(subprocess.CompletedProcess(self.cmd, returncode, kept, stderr))
 
 class NockchainWalletGUI(QMainWindow):
+    REFRESH_DEBOUNCE_MS = 100
     def __init__(self):
         super().__init__()
         self.parser = WalletOutputParser()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(4)
+        self._pending_tasks = set()
+        self._base_cmd_cache: Optional[tuple] = None
+        self._resolved_binary: Optional[str] = None
+        self._result_cache: Dict[tuple, tuple] = {}
+        self._wallet_imported: bool = config['wallet_imported']
+        self._balance_timer = self._debounce_timer(self._do_refresh_balance)
+        self._notes_timer = self._debounce_timer(self._do_load_notes)
+        # Créé avant l'onglet Notes, qui n'est construit qu'à la première visite
+        self.notes_model = NotesModel()
+        self._lazy_tabs: Dict[int, Any] = {}
+        self._last_balance: Optional[int] = None
         self.init_ui()
         self._check_binary()
 
+    def _toast(self, message: str, level: str = "error", timeout_ms: int = 4000):
+        """Message temporaire non modal dans la barre d'état, coloré selon level (clés de LogArea.COLORS)"""
+        status_bar = self.statusBar()
+        status_bar.setPalette(self._toast_palettes.get(level, self._toast_palettes["info"]))
+        # Le message temporaire masque status_label, qui réapparaît à l'expiration
+        status_bar.showMessage(message, timeout_ms)
+
+    def _on_status_message_changed(self, message: str):
+        if not message:
+            self.statusBar().setPalette(QPalette())
+
+    def _debounce_timer(self, slot) -> QTimer:
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(slot)
+        return timer
+
     def init_ui(self):
         self.setWindowTitle("Nockchain Wallet Qt Interface v0.1.1")
         self.setGeometry(100, 100, 1000, 700)
+        # Couleurs d'état via palette: pas de re-polish comme avec setStyleSheet
+        self._palette_ok = QPalette()
+        self._palette_ok.setColor(QPalette.ColorRole.WindowText, QColor("#4CAF50"))
+        self._palette_warn = QPalette()
+        self._palette_warn.setColor(QPalette.ColorRole.WindowText, QColor("#FF9800"))
+        self._toast_palettes = {}
+        for level, color in LogArea.COLORS.items():
+            palette = QPalette()
+            palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+            self._toast_palettes[level] = palette
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
@@ -226,27 +447,42 @@ class NockchainWalletGUI(QMainWindow):
         main_layout.addWidget(title)
         wallet_group = self._create_wallet_section()
         main_layout.addWidget(wallet_group)
-        tabs = QTabWidget()
-        tabs.addTab(self._create_balance_tab(), "💰 Balance")
-        tabs.addTab(self._create_notes_tab(), "📝 Notes")
-        tabs.addTab(self._create_gas_tab(), "⛽ Gas")
-        tabs.addTab(self._create_params_tab(), "⚙️ Paramètres")
-        main_layout.addWidget(tabs)
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self._create_balance_tab(), "💰 Balance")
+        self._add_lazy_tab(self._create_notes_tab, "📝 Notes")
+        self._add_lazy_tab(self._create_gas_tab, "⛽ Gas")
+        self._add_lazy_tab(self._create_params_tab, "⚙️ Paramètres")
+        self.tabs.currentChanged.connect(self._build_lazy_tab)
+        main_layout.addWidget(self.tabs)
         log_label = QLabel("📋 Logs")
         log_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
         main_layout.addWidget(log_label)
         self.log_area = LogArea()
         main_layout.addWidget(self.log_area)
-        self.statusBar().showMessage("Prêt")
+        self.status_label = QLabel("Prêt")
+        self.statusBar().addWidget(self.status_label, 1)
+        self.statusBar().messageChanged.connect(self._on_status_message_changed)
         self.log_area.append_log("Interface Nockchain Wallet v0.1.1 initialisée", "success")
 
+    def _add_lazy_tab(self, builder, label: str):
+        """Onglet vide dont le contenu est construit à la première visite"""
+        placeholder = QWidget()
+        QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+        index = self.tabs.addTab(placeholder, label)
+        self._lazy_tabs[index] = builder
+
+    def _build_lazy_tab(self, index: int):
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).layout().addWidget(builder())
+
     def _create_wallet_section(self) -> QGroupBox:
         group = QGroupBox("💼 Wallet")
         layout = QVBoxLayout()
         path_layout = QHBoxLayout()
         path_layout.addWidget(QLabel("Chemin:"))
         self.wallet_path_label = QLabel("Aucun wallet chargé")
-        self.wallet_path_label.setStyleSheet("color: #FF9800;")
+        self.wallet_path_label.setPalette(self._palette_warn)
         path_layout.addWidget(self.wallet_path_label)
         path_layout.addStretch()
         layout.addLayout(path_layout)
@@ -269,7 +505,7 @@ class NockchainWalletGUI(QMainWindow):
         self.balance_label = QLabel("-- nicks")
         self.balance_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.balance_label.setFont(QFont("Arial", 32, QFont.Weight.Bold))
-        self.balance_label.setStyleSheet("color: #4CAF50;")
+        self.balance_label.setPalette(self._palette_ok)
         balance_layout.addWidget(self.balance_label)
         btn_refresh = QPushButton("🔄 Rafraîchir")
         btn_refresh.clicked.connect(self._refresh_balance)
@@ -281,21 +517,34 @@ class NockchainWalletGUI(QMainWindow):
         return widget
 
     def _create_notes_tab(self) -> QWidget:
+        """Crée l'onglet Notes"""
         widget = QWidget()
         layout = QVBoxLayout()
+
         options_layout = QHBoxLayout()
         self.watch_only_notes_cb = QCheckBox("Inclure notes watch-only")
         options_layout.addWidget(self.watch_only_notes_cb)
+
         btn_load_notes = QPushButton("🔄 Charger")
         btn_load_notes.clicked.connect(self._load_notes)
         options_layout.addWidget(btn_load_notes)
         options_layout.addStretch()
         layout.addLayout(options_layout)
-        self.notes_table = QTableWidget()
-        self.notes_table.setColumnCount(1)
-        self.notes_table.setHorizontalHeaderLabels(["Note"])
-        self.notes_table.horizontalHeader().setStretchLastSection(True)
-        layout.addWidget(self.notes_table)
+
+        self.notes_view = QTableView()
+        self.notes_view.setModel(self.notes_model)
+
+        # Tailles de colonnes
+        self.notes_view.setColumnWidth(0, 40)   # Checkbox
+        self.notes_view.setColumnWidth(2, 150)  # Montant
+        self.notes_view.setColumnWidth(3, 80)   # Confirmations
+
+        header = self.notes_view.horizontalHeader()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Note ID stretch
+
+        layout.addWidget(self.notes_view)
+
         widget.setLayout(layout)
         return widget
 
@@ -361,7 +610,18 @@ class NockchainWalletGUI(QMainWindow):
         return widget
 
     def _build_base_command(self) -> list:
-        cmd = [config['wallet_binary']]
+        if self._base_cmd_cache is None:
+            self._base_cmd_cache = tuple(self._compute_base_command())
+        return list(self._base_cmd_cache)
+
+    def _resolve_binary(self) -> Optional[str]:
+        """Chemin absolu du binaire, recherché une seule fois dans le PATH"""
+        if self._resolved_binary is None:
+            self._resolved_binary = shutil.which(config['wallet_binary'])
+        return self._resolved_binary
+
+    def _compute_base_command(self) -> list:
+        cmd = [self._resolve_binary() or config['wallet_binary']]
         if config['client_type'] == 'public':
             cmd.extend(['--client', 'public'])
             if config['public_server'] and config['public_server'] != 'https://nockchain-api.zorp.io':
@@ -372,19 +632,92 @@ class NockchainWalletGUI(QMainWindow):
                 cmd.extend(['--private-grpc-server-port', config['private_port']])
         return cmd
 
-    def _check_binary(self):
-        try:
-            result = subprocess.run(
-                [config['wallet_binary'], '--help'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+    def _run_wallet_command(self, args: list, on_finished, on_failed, timeout: int = 30,
+                            capture_stdout: bool = True, on_line=None, keep_line=None):
+        """Lance une sous-commande du wallet (point d'entrée unique vers le binaire)"""
+        cmd = self._build_base_command() + args
+        self.log_area.append_log(f"$ {_format_command(tuple(cmd))}", "command")
+        self._start_task(cmd, on_finished, on_failed, timeout, capture_stdout, on_line, keep_line)
+
+    def _run_cached_command(self, subcommand: str, ttl_key: str, on_finished, on_failed, **options):
+        """Comme _run_wallet_command, mais rejoue un résultat réussi plus récent que config[ttl_key] ms"""
+        key = (subcommand, config['wallet_path'])
+        entry = self._result_cache.get(key)
+        if entry and time.monotonic() - entry[0] < config[ttl_key] / 1000:
+            on_finished(entry[1])
+            return
+        def store(result):
             if result.returncode == 0:
-                self.log_area.append_log(f"✓ Binaire trouvé: {config['wallet_binary']}", "success")
-            else:
-                self.log_area.append_log(f"⚠ Binaire non fonctionnel", "warning")
-        except FileNotFoundError:
+                self._result_cache[key] = (time.monotonic(), result)
+            on_finished(result)
+        self._run_wallet_command([subcommand], store, on_failed, **options)
+
+    def _start_task(self, cmd: list, on_finished, on_failed, timeout: int,
+                    capture_stdout: bool = True, on_line=None, keep_line=None,
+                    capture_stderr: bool = True):
+        """Exécute cmd dans le pool; les callbacks sont appelés dans le thread Qt.
+        Avec on_line, la sortie est remontée ligne par ligne pendant l'exécution;
+        avec keep_line, stdout est la liste des lignes acceptées (strippées)."""
+        if on_line:
+            task = StreamingWalletTask(cmd, timeout)
+            task.signals.line.connect(on_line)
+        elif keep_line:
+            task = FilteredWalletTask(cmd, timeout, keep_line)
+        else:
+            task = WalletTask(cmd, timeout, capture_stdout, capture_stderr)
+        self._pending_tasks.add(task)
+        task.signals.finished.connect(lambda _: self._pending_tasks.discard(task))
+        task.signals.failed.connect(lambda _: self._pending_tasks.discard(task))
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        self._pool.start(task)
+
+    def _binary_fingerprint(self) -> Optional[Dict[str, Any]]:
+        """Chemin résolu + mtime du binaire, pour le cache de vérification"""
+        binary_path = self._resolve_binary()
+        if not binary_path:
+            return None
+        try:
+            return {'path': binary_path, 'mtime': os.path.getmtime(binary_path)}
+        except OSError:
+            return None
+
+    def _probe_matches(self, fingerprint: Optional[Dict[str, Any]]) -> bool:
+        """Vrai si '--help' a déjà réussi pour ce chemin et ce mtime"""
+        probe = config.get('binary_probe')
+        return bool(fingerprint and probe and probe.get('ok') and
+                    probe.get('path') == fingerprint['path'] and
+                    probe.get('mtime') == fingerprint['mtime'])
+
+    def _check_binary(self):
+        """Recherche PATH + stat; '--help' seulement si le binaire diffère du dernier succès"""
+        fingerprint = self._binary_fingerprint()
+        if fingerprint is None:
+            self._on_check_binary_failed(FileNotFoundError(config['wallet_binary']))
+            return
+        if self._probe_matches(fingerprint):
+            self.log_area.append_log(f"✓ Binaire trouvé: {config['wallet_binary']}", "success")
+            return
+        self._start_task(
+            [fingerprint['path'], '--help'],
+            lambda result: self._on_check_binary_finished(result, fingerprint),
+            self._on_check_binary_failed,
+            timeout=5,
+            capture_stdout=False,
+            capture_stderr=False
+        )
+
+    def _on_check_binary_finished(self, result, fingerprint: Optional[Dict[str, Any]]):
+        if result.returncode == 0:
+            self.log_area.append_log(f"✓ Binaire trouvé: {config['wallet_binary']}", "success")
+            if fingerprint:
+                config['binary_probe'] = {**fingerprint, 'ok': True}
+                save_config()
+        else:
+            self.log_area.append_log(f"⚠ Binaire non fonctionnel", "warning")
+
+    def _on_check_binary_failed(self, error: Exception):
+        if isinstance(error, FileNotFoundError):
             self.log_area.append_log(f"✗ Binaire non trouvé: {config['wallet_binary']}", "error")
             QMessageBox.warning(
                 self,
@@ -392,8 +725,8 @@ class NockchainWalletGUI(QMainWindow):
                 f"Le binaire '{config['wallet_binary']}' est introuvable.\n"
                 "Veuillez le configurer dans l'onglet Paramètres."
             )
-        except Exception as e:
-            self.log_area.append_log(f"✗ Erreur: {str(e)}", "error")
+        else:
+            self.log_area.append_log(f"✗ Erreur: {str(error)}", "error")
 
     def _import_wallet(self):
         source_file, _ = QFileDialog.getOpenFileName(
@@ -404,64 +737,78 @@ class NockchainWalletGUI(QMainWindow):
         )
         if not source_file:
             return
+        self.log_area.append_log(f"📥 Import depuis: {Path(source_file).name}", "info")
+        self._run_wallet_command(
+            ['import-keys', '--file', source_file],
+            lambda result: self._on_import_finished(result, source_file),
+            self._on_import_failed,
+            timeout=60,
+            on_line=self._on_import_line
+        )
+
+    def _on_import_line(self, line: str):
+        # Codes ANSI, trace/debug et boot du kernel: même filtre que extract_error
+        if _RE_ERROR_NOISE.search(line):
+            return
+        clean = self.parser.clean_output(line)
+        if clean:
+            self.log_area.append_log(clean, "info")
+
+    def _on_import_finished(self, result, source_file: str):
         try:
-            self.log_area.append_log(f"📥 Import depuis: {Path(source_file).name}", "info")
-            cmd = self._build_base_command()
-            cmd.append('import-keys')
-            cmd.extend(['--file', source_file])
-            self.log_area.append_log(f"$ {' '.join(cmd)}", "command")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
             if result.returncode == 0:
                 success_msg = self.parser.extract_success_message(result.stdout)
                 if success_msg:
                     self.log_area.append_log(success_msg, "success")
                 else:
                     self.log_area.append_log("✓ Import réussi", "success")
-                default_wallet = Path.home() / ".nockchain" / "wallet.dat"
-                time.sleep(0.5)
-                if default_wallet.exists():
-                    config['wallet_path'] = str(default_wallet)
-                    config['wallet_imported'] = True
-                    save_config()
-                    self.wallet_path_label.setText(str(default_wallet))
-                    self.wallet_path_label.setStyleSheet("color: #4CAF50;")
-                    self.statusBar().showMessage(f"Wallet: {default_wallet.name}")
-                    self.log_area.append_log(f"✓ Wallet trouvé: {default_wallet}", "success")
-                    self._refresh_balance()
-                    self._load_notes()
-                else:
-                    alt_wallet = Path.home() / "wallet.wallet"
-                    if alt_wallet.exists():
-                        config['wallet_path'] = str(alt_wallet)
-                        config['wallet_imported'] = True
-                        save_config()
-                        self.wallet_path_label.setText(str(alt_wallet))
-                        self.wallet_path_label.setStyleSheet("color: #4CAF50;")
-                        self.statusBar().showMessage(f"Wallet: {alt_wallet.name}")
-                        self.log_area.append_log(f"✓ Wallet trouvé: {alt_wallet}", "success")
-                        self._refresh_balance()
-                        self._load_notes()
-                    else:
-                        config['wallet_imported'] = True
-                        save_config()
-                        self.wallet_path_label.setText("Wallet par défaut")
-                        self.wallet_path_label.setStyleSheet("color: #4CAF50;")
-                        self.log_area.append_log("✓ Utilisation du wallet par défaut", "success")
-                        self._refresh_balance()
-                        self._load_notes()
-                QMessageBox.information(self, "Succès", f"Import réussi depuis {Path(source_file).name}")
+                # Laisse le wallet finir d'écrire ses fichiers sans bloquer la boucle Qt
+                QTimer.singleShot(500, lambda: self._locate_imported_wallet(source_file))
             else:
+                # Les lignes d'erreur ont déjà été affichées au fil de l'eau
                 error = self.parser.extract_error(result.stderr)
-                self.log_area.append_log(f"✗ Erreur: {error}", "error")
+                self.log_area.append_log("✗ Échec de l'import", "error")
                 QMessageBox.critical(self, "Erreur", f"Échec de l'import:\n{error}")
-        except subprocess.TimeoutExpired:
-            self.log_area.append_log("✗ Timeout lors de l'import", "error")
         except Exception as e:
             self.log_area.append_log(f"✗ Erreur: {str(e)}", "error")
-            logger.error(f"Erreur import wallet: {e}")
+            logger.error("Erreur import wallet: %s", e)
+
+    def _locate_imported_wallet(self, source_file: str):
+        self._result_cache.clear()
+        try:
+            candidates = (
+                Path.home() / ".nockchain" / "wallet.dat",
+                Path.home() / "wallet.wallet",
+            )
+            found = next((path for path in candidates if path.exists()), None)
+            config['wallet_imported'] = True
+            self._wallet_imported = True
+            if found is not None:
+                config['wallet_path'] = str(found)
+                self.wallet_path_label.setText(str(found))
+                self.status_label.setText(f"Wallet: {found.name}")
+                self.log_area.append_log(f"✓ Wallet trouvé: {found}", "success")
+            else:
+                self.wallet_path_label.setText("Wallet par défaut")
+                self.log_area.append_log("✓ Utilisation du wallet par défaut", "success")
+            save_config()
+            self.wallet_path_label.setPalette(self._palette_ok)
+            # Une seule vague: solde et notes partent ensemble dans le pool
+            self._refresh_all()
+            QMessageBox.information(self, "Succès", f"Import réussi depuis {Path(source_file).name}")
+        except Exception as e:
+            self.log_area.append_log(f"✗ Erreur: {str(e)}", "error")
+            logger.error("Erreur import wallet: %s", e)
+
+    def _on_import_failed(self, error: Exception):
+        if isinstance(error, subprocess.TimeoutExpired):
+            self.log_area.append_log("✗ Timeout lors de l'import", "error")
+        else:
+            self.log_area.append_log(f"✗ Erreur: {str(error)}", "error")
+            logger.error("Erreur import wallet: %s", error)
 
     def _export_wallet(self):
-        if not config['wallet_imported']:
+        if not self._wallet_imported:
             QMessageBox.warning(self, "Attention", "Veuillez importer un wallet d'abord")
             return
         output_file, _ = QFileDialog.getSaveFileName(
@@ -472,41 +819,58 @@ class NockchainWalletGUI(QMainWindow):
         )
         if not output_file:
             return
-        try:
-            cmd = self._build_base_command()
-            cmd.append('export-keys')
-            cmd.extend(['--output', output_file])
-            self.log_area.append_log(f"$ {' '.join(cmd)}", "command")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                self.log_area.append_log(f"✓ Export réussi: {Path(output_file).name}", "success")
-                QMessageBox.information(self, "Succès", f"Wallet exporté vers:\n{output_file}")
-            else:
-                error = self.parser.extract_error(result.stderr)
-                self.log_area.append_log(f"✗ Erreur: {error}", "error")
-                QMessageBox.critical(self, "Erreur", f"Échec de l'export:\n{error}")
-        except Exception as e:
-            self.log_area.append_log(f"✗ Erreur: {str(e)}", "error")
-            logger.error(f"Erreur export wallet: {e}")
+        self._run_wallet_command(
+            ['export-keys', '--output', output_file],
+            lambda result: self._on_export_finished(result, output_file),
+            self._on_export_failed,
+            capture_stdout=False
+        )
+
+    def _on_export_finished(self, result, output_file: str):
+        if result.returncode == 0:
+            self.log_area.append_log(f"✓ Export réussi: {Path(output_file).name}", "success")
+            QMessageBox.information(self, "Succès", f"Wallet exporté vers:\n{output_file}")
+        else:
+            error = self.parser.extract_error(result.stderr)
+            self.log_area.append_log(f"✗ Erreur: {error}", "error")
+            QMessageBox.critical(self, "Erreur", f"Échec de l'export:\n{error}")
+
+    def _on_export_failed(self, error: Exception):
+        self.log_area.append_log(f"✗ Erreur: {str(error)}", "error")
+        logger.error("Erreur export wallet: %s", error)
+
+    def _refresh_all(self):
+        """Solde et notes en parallèle: les deux commandes partent ensemble dans le pool"""
+        self._refresh_balance()
+        self._load_notes()
 
     def _refresh_balance(self):
-        if not config['wallet_imported']:
+        """Regroupe les demandes rapprochées en une seule exécution"""
+        self._balance_timer.start(self.REFRESH_DEBOUNCE_MS)
+
+    def _do_refresh_balance(self):
+        if not self._wallet_imported:
             self.log_area.append_log("⚠ Veuillez importer un wallet d'abord", "warning")
             return
+        self._run_cached_command(
+            'show-balance', 'balance_cache_ttl_ms', self._on_balance_finished, self._on_balance_failed
+        )
+
+    def _on_balance_finished(self, result):
         try:
-            cmd = self._build_base_command()
-            cmd.append('show-balance')
-            self.log_area.append_log(f"$ {' '.join(cmd)}", "command")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             if result.returncode == 0:
                 output = result.stdout
-                balance_info = self.parser.parse_balance(output)
-                wallet_version = self.parser.parse_wallet_version(output)
-                height = self.parser.parse_height(output)
-                num_notes = self.parser.parse_number_of_notes(output)
-                block_hash = self.parser.parse_block_hash(output)
+                status = self.parser.parse_status(output)
+                balance_info = status['balance']
+                wallet_version = status['version']
+                height = status['height']
+                num_notes = status['notes']
+                block_hash = status['block_hash']
                 if balance_info:
-                    self.balance_label.setText(balance_info['formatted'])
+                    # Solde inchangé: pas de setText ni de relayout du label 32pt
+                    if balance_info['balance'] != self._last_balance:
+                        self._last_balance = balance_info['balance']
+                        self.balance_label.setText(balance_info['formatted'])
                     self.log_area.append_log(f"💰 Balance: {balance_info['formatted']}", "success")
                     if num_notes is not None:
                         self.log_area.append_log(f"📝 Nombre de notes: {num_notes}", "info")
@@ -527,44 +891,54 @@ class NockchainWalletGUI(QMainWindow):
             else:
                 error = self.parser.extract_error(result.stderr)
                 self.log_area.append_log(f"✗ Erreur: {error}", "error")
-        except subprocess.TimeoutExpired:
+                self._toast("✗ Échec de la récupération du solde", "error")
+        except Exception as e:
+            self.log_area.append_log(f"✗ Erreur: {str(e)}", "error")
+            logger.error("Erreur refresh balance: %s", e)
+
+    def _on_balance_failed(self, error: Exception):
+        self._toast("✗ Échec de la récupération du solde", "error")
+        if isinstance(error, subprocess.TimeoutExpired):
             self.log_area.append_log("✗ Timeout lors de la récupération du solde", "error")
+        else:
+            self.log_area.append_log(f"✗ Erreur: {str(error)}", "error")
+            logger.error("Erreur refresh balance: %s", error)
+
+    def _load_notes(self):
+        """Regroupe les demandes rapprochées en une seule exécution"""
+        self._notes_timer.start(self.REFRESH_DEBOUNCE_MS)
+
+    def _do_load_notes(self):
+        if not self._wallet_imported:
+            self.log_area.append_log("⚠ Veuillez importer un wallet d'abord", "warning")
+            return
+        self._run_cached_command(
+            'list-notes', 'notes_cache_ttl_ms', self._on_notes_finished, self._on_notes_failed,
+            keep_line=self.parser.is_note_line
+        )
+
+    def _on_notes_finished(self, result):
+        try:
+            if result.returncode == 0:
+                # Lignes déjà filtrées par is_note_line dans FilteredWalletTask
+                notes = list(result.stdout)
+                self.notes_model.set_notes(notes)
+                self.log_area.append_log(f"📝 {len(notes)} note(s) chargée(s)", "success")
+            else:
+                error = self.parser.extract_error(result.stderr)
+                self.log_area.append_log(f"✗ Erreur: {error}", "error")
+                self._toast("✗ Échec du chargement des notes", "error")
         except Exception as e:
             self.log_area.append_log(f"✗ Erreur: {str(e)}", "error")
-            logger.error(f"Erreur refresh balance: {e}")
+            logger.error("Erreur chargement notes: %s", e)
 
-    def _create_notes_tab(self) -> QWidget:
-        """Crée l'onglet Notes"""
-        widget = QWidget()
-        layout = QVBoxLayout()
-    
-        options_layout = QHBoxLayout()
-        self.watch_only_notes_cb = QCheckBox("Inclure notes watch-only")
-        options_layout.addWidget(self.watch_only_notes_cb)
-    
-        btn_load_notes = QPushButton("🔄 Charger")
-        btn_load_notes.clicked.connect(self._load_notes)
-        options_layout.addWidget(btn_load_notes)
-        options_layout.addStretch()
-        layout.addLayout(options_layout)
-    
-        self.notes_table = QTableWidget()
-        self.notes_table.setColumnCount(4)
-        self.notes_table.setHorizontalHeaderLabels(["☑", "Note ID", "Montant", "Conf."])
-    
-        # Tailles de colonnes
-        self.notes_table.setColumnWidth(0, 40)   # Checkbox
-        self.notes_table.setColumnWidth(2, 150)  # Montant
-        self.notes_table.setColumnWidth(3, 80)   # Confirmations
-    
-        header = self.notes_table.horizontalHeader()
-        header.setStretchLastSection(False)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Note ID stretch
-    
-        layout.addWidget(self.notes_table)
-    
-        widget.setLayout(layout)
-        return widget
+    def _on_notes_failed(self, error: Exception):
+        self._toast("✗ Échec du chargement des notes", "error")
+        if isinstance(error, subprocess.TimeoutExpired):
+            self.log_area.append_log("✗ Timeout lors du chargement des notes", "error")
+        else:
+            self.log_area.append_log(f"✗ Erreur: {str(error)}", "error")
+            logger.error("Erreur chargement notes: %s", error)
 
     def _on_client_type_changed(self):
         if self.public_client_rb.isChecked():
@@ -585,33 +959,53 @@ class NockchainWalletGUI(QMainWindow):
             self.binary_path_input.setText(binary_file)
 
     def _save_params(self):
+        binary_changed = self.binary_path_input.text() != config['wallet_binary']
         config['wallet_binary'] = self.binary_path_input.text()
         config['client_type'] = 'public' if self.public_client_rb.isChecked() else 'private'
         config['public_server'] = self.public_server_input.text()
         config['private_port'] = self.private_port_input.text()
+        self._base_cmd_cache = None
+        if binary_changed:
+            self._resolved_binary = None
+        self._result_cache.clear()
         save_config()
         self.log_area.append_log("✓ Paramètres sauvegardés", "success")
         QMessageBox.information(self, "Succès", "Paramètres sauvegardés")
-        self._check_binary()
+        # Chemin ou mtime différent du dernier succès (binaire réinstallé sur place inclus)
+        if not self._probe_matches(self._binary_fingerprint()):
+            self._check_binary()
+
+# Thème sombre: (rôle, RGB)
+_DARK_PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, (53, 53, 53)),
+    (QPalette.ColorRole.WindowText, (255, 255, 255)),
+    (QPalette.ColorRole.Base, (25, 25, 25)),
+    (QPalette.ColorRole.AlternateBase, (53, 53, 53)),
+    (QPalette.ColorRole.ToolTipBase, (255, 255, 255)),
+    (QPalette.ColorRole.ToolTipText, (255, 255, 255)),
+    (QPalette.ColorRole.Text, (255, 255, 255)),
+    (QPalette.ColorRole.Button, (53, 53, 53)),
+    (QPalette.ColorRole.ButtonText, (255, 255, 255)),
+    (QPalette.ColorRole.BrightText, (255, 0, 0)),
+    (QPalette.ColorRole.Link, (42, 130, 218)),
+    (QPalette.ColorRole.Highlight, (42, 130, 218)),
+    (QPalette.ColorRole.HighlightedText, (0, 0, 0)),
+)
+_DARK_PALETTE: Optional[QPalette] = None
+
+def _dark_palette() -> QPalette:
+    global _DARK_PALETTE
+    if _DARK_PALETTE is None:
+        palette = QPalette()
+        for role, rgb in _DARK_PALETTE_COLORS:
+            palette.setColor(role, QColor(*rgb))
+        _DARK_PALETTE = palette
+    return _DARK_PALETTE
 
 def main():
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-    app.setPalette(palette)
+    app.setPalette(_dark_palette())
     window = NockchainWalletGUI()
     window.show()
     sys.exit(app.exec())